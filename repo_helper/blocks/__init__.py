@@ -26,12 +26,12 @@ Reusable blocks of reStructuredText.
 # stdlib
 import functools
 import re
-from typing import Iterable, Optional, Sequence, Union
+from typing import Callable, Iterable, Optional, Sequence, Tuple, Union
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.stringlist import DelimitedList, StringList
-from jinja2 import BaseLoader, Environment, StrictUndefined, Template
+from jinja2 import Environment, FunctionLoader, StrictUndefined, Template
 
 # this package
 from repo_helper._docs_shields import (
@@ -80,6 +80,7 @@ from repo_helper.shields import (
 		make_rtfd_shield,
 		make_wheel_shield
 		)
+from repo_helper.templates import get_bytecode_cache
 from repo_helper.utils import resource
 
 __all__ = [
@@ -87,6 +88,7 @@ __all__ = [
 		"shields_regex",
 		"short_desc_regex",
 		"links_regex",
+		"replace_blocks",
 		"get_readme_installation_block_template",
 		"create_readme_install_block",
 		"create_short_desc_block",
@@ -99,16 +101,102 @@ __all__ = [
 		]
 
 #: Regular expression to match the installation block placeholder.
-installation_regex = re.compile(r"(?s)(\.\. start installation)(.*?)(\.\. end installation)\n")
+installation_regex = re.compile(r"\.\. start installation.*?\.\. end installation\n", re.DOTALL)
 
 #: Regular expression to match the shields block placeholder.
-shields_regex = re.compile(r"(?s)(\.\. start shields)(.*?)(\.\. end shields)")
+shields_regex = re.compile(r"\.\. start shields.*?\.\. end shields", re.DOTALL)
 
 #: Regular expression to match the short description block placeholder.
-short_desc_regex = re.compile(r"(?s)(\.\. start short[-_]desc)(.*?)(\.\. end short[-_]desc)")
+short_desc_regex = re.compile(r"\.\. start short[-_]desc.*?\.\. end short[-_]desc", re.DOTALL)
 
 #: Regular expression to match the links block placeholder.
-links_regex = re.compile(r"(?s)(\.\. start links)(.*?)(\.\. end links)")
+links_regex = re.compile(r"\.\. start links.*?\.\. end links", re.DOTALL)
+
+_blocks_regex = re.compile(
+		'|'.join([
+				f"(?P<installation>{installation_regex.pattern})",
+				f"(?P<shields>{shields_regex.pattern})",
+				f"(?P<short_desc>{short_desc_regex.pattern})",
+				f"(?P<links>{links_regex.pattern})",
+				]),
+		re.DOTALL,
+		)
+
+
+def replace_blocks(text: str, **blocks: str) -> str:
+	r"""
+	Replace the placeholder blocks in ``text`` with new content.
+
+	All placeholders are found in a single pass over the text,
+	rather than searching once for each of :py:data:`installation_regex`,
+	:py:data:`shields_regex`, :py:data:`short_desc_regex` and :py:data:`links_regex`.
+
+	:param text:
+	:param \*\*blocks: Mapping of block names (``installation``, ``shields``, ``short_desc`` or ``links``)
+		to the text to replace them with. Blocks which are not given are left unchanged.
+
+	.. versionadded:: $VERSION
+	"""
+
+	unknown_blocks = blocks.keys() - _blocks_regex.groupindex.keys()
+	if unknown_blocks:
+		raise TypeError(f"Unknown block(s): {', '.join(sorted(unknown_blocks))}")
+
+	# All blocks begin with the same marker, which str.find can locate far faster than the regex engine
+	# can scan for it. The regex is then only tried at those positions.
+	output = []
+	copied_to = search_from = 0
+
+	while True:
+		start = text.find(".. start ", search_from)
+		if start == -1:
+			break
+
+		match = _blocks_regex.match(text, start)
+		if match is None:
+			search_from = start + 1
+			continue
+
+		output.append(text[copied_to:start])
+		output.append(blocks.get(match.lastgroup, match.group()))  # type: ignore[arg-type]
+		copied_to = search_from = match.end()
+
+	output.append(text[copied_to:])
+
+	return ''.join(output)
+
+
+def _load_block_template(filename: str) -> Tuple[str, str, Callable[[], bool]]:
+	"""
+	Returns the source of the block template with the given filename.
+
+	:param filename:
+	"""
+
+	with resource("repo_helper.blocks", filename) as template_file:
+		template_text = PathPlus(template_file).read_text().replace("\\\n", '')
+
+	# The filename forms part of the bytecode cache key, so must not vary between runs
+	# (as the path from ``resource()`` does for a zipped install).
+	return template_text, f"repo_helper.blocks/{filename}", lambda: True
+
+
+_block_template_loader = FunctionLoader(_load_block_template)
+
+
+@functools.lru_cache(1)
+def _get_environment() -> Environment:
+	"""
+	Returns the environment used for the block templates.
+
+	Compiled templates are cached on disk between invocations of ``repo_helper`` where possible.
+	"""
+
+	return Environment(  # nosec: B701
+			loader=_block_template_loader,
+			undefined=StrictUndefined,
+			bytecode_cache=get_bytecode_cache(),
+			)
 
 
 def template_from_file(filename: str, **globals) -> Template:  # pylint: disable=redefined-builtin
@@ -119,15 +207,10 @@ def template_from_file(filename: str, **globals) -> Template:  # pylint: disable
 	:param \*\*globals:
 	"""
 
-	with resource("repo_helper.blocks", filename) as shields_block_template_file:
-		template_text = PathPlus(shields_block_template_file).read_text().replace("\\\n", '')
-
-		environment = Environment(loader=BaseLoader(), undefined=StrictUndefined)  # nosec: B701
-
-		if globals:
-			return environment.from_string(template_text, globals=globals)
-		else:
-			return environment.from_string(template_text)
+	# Load through the loader rather than Environment.get_template so each call gets its own Template.
+	# Templates from the environment's cache are shared, and get_template would merge ``globals`` into them.
+	environment = _get_environment()
+	return _block_template_loader.load(environment, filename, environment.make_globals(globals))
 
 
 @functools.lru_cache(1)
@@ -135,6 +218,11 @@ def get_readme_installation_block_template() -> Template:
 	"""
 	Loads the readme_installation_block template from file
 	and returns a jinja2 :class:`jinja2.environment.Template` for it.
+
+	.. versionchanged:: $VERSION
+
+		The template now takes ``conda_channel_commands``, the pre-rendered ``conda config`` commands,
+		in place of the list of ``conda_channels``.
 	"""  # noqa: D400
 
 	return template_from_file("readme_installation_block_template.rst")
@@ -200,12 +288,17 @@ def create_readme_install_block(
 		pypi_name = modname
 
 	if pypi:
+		conda_channel_commands = '\n'.join([
+				f"\t\t$ conda config --add channels https://conda.anaconda.org/{channel}"
+				for channel in conda_channels or ()
+				])
+
 		return get_readme_installation_block_template().render(
 				modname=modname,
 				username=username,
 				conda=conda,
 				pypi_name=pypi_name,
-				conda_channels=conda_channels,
+				conda_channel_commands=conda_channel_commands,
 				)
 	else:
 		return ".. start installation\n.. end installation\n"
@@ -256,8 +349,6 @@ def create_docs_install_block(
 	if not pypi_name:
 		pypi_name = repo_name
 
-	conda_channels = DelimitedList(conda_channels or [])
-
 	block = StringList([".. start installation", '', f".. installation:: {pypi_name}"])
 
 	with block.with_indent_size(1):
@@ -269,7 +360,7 @@ def create_docs_install_block(
 
 		if conda:
 			block.append(":anaconda:")
-			block.append(f":conda-channels: {conda_channels:, }")
+			block.append(f":conda-channels: {', '.join(conda_channels or ())}")
 
 	block.blankline()
 	block.append(".. end installation")
@@ -307,6 +398,7 @@ class ShieldsBlock:
 	:param docker_shields: Whether to show shields for Docker. Default :py:obj:`False`.
 	:param docker_name: The name of the Docker image on DockerHub.
 	:param platforms: List of supported platforms.
+		If this is a :class:`frozenset` it is used as-is, otherwise it is copied into a :class:`set`.
 	:param on_pypi:
 	:param primary_conda_channel: The Conda channel the package can be downloaded from.
 
@@ -387,7 +479,7 @@ class ShieldsBlock:
 		self.unique_name: str = str(unique_name)
 		self.docker_shields: bool = docker_shields
 		self.docker_name: str = str(docker_name)
-		self.platforms: Iterable[str] = set(platforms or ())
+		self.platforms: Iterable[str] = platforms if isinstance(platforms, frozenset) else set(platforms or ())
 		self.on_pypi: bool = on_pypi
 		self.primary_conda_channel: str = primary_conda_channel or self.username
 
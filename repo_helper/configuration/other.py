@@ -24,6 +24,7 @@ r"""
 #
 
 # stdlib
+import functools
 import re
 from typing import Any, Dict, List, Optional
 
@@ -131,6 +132,19 @@ class exclude_files(ConfigVar):
 	default: List[str] = []
 
 
+@functools.lru_cache(maxsize=128)
+def _check_regex(pattern: str) -> str:
+	"""
+	Ensure ``pattern`` is a valid regular expression, and return it unchanged.
+
+	Results are cached so repeatedly loading the same configuration skips recompiling the pattern.
+
+	:param pattern:
+	"""
+
+	return re.compile(pattern).pattern
+
+
 class pre_commit_exclude(ConfigVar):
 	r"""
 	Regular expression for files that should not be checked by pre_commit.
@@ -145,7 +159,7 @@ class pre_commit_exclude(ConfigVar):
 
 	@classmethod
 	def validate(cls, raw_config_vars: Optional[Dict[str, Any]] = None) -> Any:  # noqa: D102
-		return re.compile(super().validate(raw_config_vars)).pattern
+		return _check_regex(super().validate(raw_config_vars))
 
 
 class desktopfile(ConfigVar):
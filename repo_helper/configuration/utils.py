@@ -35,6 +35,8 @@ from shippinglabel.requirements import ComparableRequirement, combine_requiremen
 
 __all__ = ["get_tox_python_versions", "get_version_classifiers", "parse_extras"]
 
+_pre_release_re = re.compile(".*(-dev|alpha|beta)")
+
 
 def get_tox_python_versions(python_versions: Iterable[str]) -> List[str]:
 	"""
@@ -70,7 +72,7 @@ def get_version_classifiers(python_versions: Iterable[str]) -> List[str]:
 	for py_version in python_versions:
 		py_version = str(py_version)
 
-		if re.match(".*(-dev|alpha|beta)", py_version):
+		if _pre_release_re.match(py_version):
 			continue
 
 		if py_version.startswith('3'):
@@ -41,7 +41,7 @@ from repo_helper.files import Management, is_registered, management
 from repo_helper.files.docs import copy_docs_styling
 from repo_helper.files.linting import code_only_warning, lint_warn_list
 from repo_helper.files.testing import make_formate_toml, make_isort
-from repo_helper.templates import Environment, init_repo_template_dir, template_dir
+from repo_helper.templates import Environment, get_bytecode_cache, init_repo_template_dir, template_dir
 from repo_helper.utils import brace, discover_entry_points
 
 __all__ = [
@@ -90,6 +90,7 @@ class RepoHelper:
 		self.templates = Environment(  # nosec: B701
 			loader=jinja2.FileSystemLoader(str(template_dir)),
 			undefined=jinja2.StrictUndefined,
+			bytecode_cache=get_bytecode_cache(),
 			)
 		self.templates.globals["managed_message"] = managed_message
 		self.templates.globals["brace"] = brace
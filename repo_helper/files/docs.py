@@ -56,10 +56,7 @@ from repo_helper.blocks import (
 		ShieldsBlock,
 		create_docs_install_block,
 		create_docs_links_block,
-		installation_regex,
-		links_regex,
-		shields_regex,
-		short_desc_regex
+		replace_blocks
 		)
 from repo_helper.configupdater2 import ConfigUpdater
 from repo_helper.files import management
@@ -643,13 +640,12 @@ def rewrite_docs_index(repo_path: pathlib.Path, templates: Environment) -> List[
 			)
 
 	# Do the replacement
-	index_rst = index_rst_file.read_text(encoding="UTF-8")
-	index_rst = shields_regex.sub(shields_block, index_rst)
-	index_rst = installation_regex.sub(install_block, index_rst)
-	index_rst = links_regex.sub(links_block, index_rst)
-	index_rst = short_desc_regex.sub(
-			".. start short_desc\n\n.. documentation-summary::\n\t:meta:\n\n.. end short_desc",
-			index_rst,
+	index_rst = replace_blocks(
+			index_rst_file.read_text(encoding="UTF-8"),
+			shields=shields_block,
+			installation=install_block,
+			links=links_block,
+			short_desc=".. start short_desc\n\n.. documentation-summary::\n\t:meta:\n\n.. end short_desc",
 			)
 
 	if ":caption: Links" not in index_rst and not templates.globals["preserve_custom_theme"]:
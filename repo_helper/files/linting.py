@@ -27,6 +27,7 @@ Configuration for various linting tools, such as
 
 # stdlib
 import pathlib
+import shutil
 from typing import List
 
 # 3rd party
@@ -312,5 +313,8 @@ def make_pylintrc(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
 
 	file = PathPlus(repo_path / ".pylintrc")
-	file.write_clean(PathPlus(template_dir / "pylintrc").read_text())
+
+	# The template is already clean, so can be copied as-is without being reformatted.
+	shutil.copyfile(template_dir / "pylintrc", file)
+
 	return [file.name]
@@ -24,20 +24,18 @@ Configuration for `pre-commit <https://pre-commit.com>`_.
 #
 
 # stdlib
+import copy
 import functools
 import pathlib
 import posixpath
 import re
 from io import StringIO
-from textwrap import indent
-from typing import Iterable, List, MutableMapping, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 # 3rd party
 import attr
-import ruamel.yaml
 from apeye.url import URL
 from domdf_python_tools.paths import PathPlus
-from domdf_python_tools.stringlist import StringList
 from ruamel.yaml import YAML
 from typing_extensions import Literal, TypedDict
 
@@ -52,6 +50,11 @@ GITHUB_COM: URL = URL("https://github.com")
 
 yaml_safe_loader = YAML(typ="safe", pure=True)
 
+# Constructing and configuring a YAML instance is comparatively expensive, so one is shared between calls.
+# It is not reentrant, so must not be used from multiple threads at once.
+yaml_dumper = YAML()
+yaml_dumper.indent(mapping=2, sequence=3, offset=1)
+
 
 @functools.lru_cache()
 def make_github_url(username: str, repository: str) -> URL:
@@ -122,10 +125,11 @@ class Hook(_BaseHook, total=False):
 
 
 def _hook_converter(hooks: Iterable[Union[str, Hook]]) -> List[Hook]:
-	return [hook if isinstance(hook, dict) else {"id": hook} for hook in hooks]
+	# The exact type check short-circuits the common case of plain hook ids.
+	return [{"id": hook} if hook.__class__ is str or not isinstance(hook, dict) else hook for hook in hooks]
 
 
-@attr.s
+@attr.s(slots=True)
 class Repo:
 	"""
 	Represents a repository providing a pre-commit hooks.
@@ -222,6 +226,125 @@ pyproject_parser = Repo(
 # 		)
 
 
+# Strings which can be written as plain (unquoted) YAML scalars without any ambiguity.
+# This is deliberately conservative; anything else is left to ruamel.yaml to decide how to quote.
+_plain_scalar_re = re.compile(r"(?!-$|---|\.\.\.)[A-Za-z0-9_./^$()\\-][A-Za-z0-9_./^$()|\\*+?=<>:~-]*(?<!:)")
+
+# Plain strings which YAML would load as something other than a string.
+_non_string_re = re.compile(r"[-+]?[\d._]|(?i:true|false|yes|no|on|off|y|n|null)$")
+
+
+def _is_plain_scalar(value: Any) -> bool:
+	return isinstance(value, str) and bool(_plain_scalar_re.fullmatch(value)) and not _non_string_re.match(value)
+
+
+def _mapping_to_yaml_lines(mapping: Mapping[str, Any], prefix: str) -> Optional[List[str]]:
+	"""
+	Serialise a mapping of strings, lists of strings and lists of such mappings to YAML,
+	with the same layout as ``yaml_dumper``.
+
+	Returns :py:obj:`None` if the mapping contains anything else.
+
+	:param mapping:
+	:param prefix: The indent of the mapping's keys.
+	"""  # noqa: D400
+
+	lines: List[str] = []
+
+	for key, value in mapping.items():
+		if not _is_plain_scalar(key):
+			return None
+
+		if _is_plain_scalar(value):
+			line = f"{prefix}{key}: {value}"
+
+			# ruamel.yaml moves long values onto their own line.
+			if len(line) > 80:
+				return None
+
+			lines.append(line)
+			continue
+
+		if not isinstance(value, list) or not value:
+			return None
+
+		lines.append(f"{prefix}{key}:")
+
+		for item in value:
+			if _is_plain_scalar(item):
+				lines.append(f"{prefix} - {item}")
+			elif isinstance(item, dict) and item:
+				item_lines = _mapping_to_yaml_lines(item, f"{prefix}   ")
+				if item_lines is None:
+					return None
+				item_lines[0] = f"{prefix} - {item_lines[0].lstrip()}"
+				lines.extend(item_lines)
+			else:
+				return None
+
+	return lines
+
+
+def _dump_repo(repo: Mapping[str, Any]) -> str:
+	"""
+	Returns the YAML representation of a repository for the ``repos`` list of ``.pre-commit-config.yaml``.
+
+	The simple repositories and hooks generated by ``repo_helper`` are serialised directly,
+	which is much faster than going through ruamel.yaml.
+
+	:param repo:
+	"""
+
+	lines = _mapping_to_yaml_lines(repo, "   ")
+
+	if lines is not None:
+		lines[0] = f" - {lines[0].lstrip()}"
+		return '\n'.join(lines)
+
+	buf = StringIO()
+	yaml_dumper.dump(repo, buf)
+	first_line, *other_lines = buf.getvalue().splitlines()
+
+	return '\n'.join([f" - {first_line}", *(f"   {line}" if line.strip() else line for line in other_lines)])
+
+
+# The YAML for the repositories above is only generated once, along with a copy of the dictionary it was
+# generated from so that any changes made to their (mutable) hooks are still picked up.
+# Repo instances are unhashable, so are looked up by identity.
+_static_repo_yaml = {
+		id(repo): (copy.deepcopy(repo.to_dict()), _dump_repo(repo.to_dict()))
+		for repo in (pre_commit_hooks, pygrep_hooks, pyupgrade, lucas_c_hooks, flake2lint, pyproject_parser)
+		}
+
+
+def _repo_yaml(repo: Repo) -> str:
+	"""
+	Returns the YAML representation of ``repo``, reusing the pregenerated YAML if it is unchanged.
+
+	:param repo:
+	"""
+
+	repo_dict = repo.to_dict()
+
+	if id(repo) in _static_repo_yaml:
+		static_dict, static_yaml = _static_repo_yaml[id(repo)]
+		if repo_dict == static_dict:
+			return static_yaml
+
+	return _dump_repo(repo_dict)
+
+
+def _exclude_pattern(paths: Tuple[str, ...], suffix: str) -> str:
+	"""
+	Construct a regular expression matching any of the given paths (without the file suffix).
+
+	:param paths: Regular expressions for the paths to match.
+	:param suffix: Regular expression for the file suffix.
+	"""
+
+	return fr"^({'|'.join(paths)}){suffix}$"
+
+
 @management.register("pre-commit", ["enable_pre_commit"])
 def make_pre_commit(repo_path: pathlib.Path, templates: Environment) -> List[str]:
 	"""
@@ -249,7 +372,10 @@ def make_pre_commit(repo_path: pathlib.Path, templates: Environment) -> List[str
 					{"id": "requirements-txt-sorter", "args": ["--allow-git"]},
 					{
 							"id": "check-docstring-first",
-							"exclude": fr"^({'|'.join(non_source_files)}|{templates.globals['tests_dir']}/.*)\.py$"
+							"exclude": _exclude_pattern(
+									(*non_source_files, f"{templates.globals['tests_dir']}/.*"),
+									r"\.py",
+									),
 							},
 					"bind-requirements",
 					]
@@ -270,7 +396,7 @@ def make_pre_commit(repo_path: pathlib.Path, templates: Environment) -> List[str
 			hooks=["snippet-fmt"],
 			)
 
-	formate_excludes = fr"^({'|'.join([*templates.globals['yapf_exclude'], *non_source_files])})\.(_)?py$"
+	formate_excludes = _exclude_pattern((*templates.globals["yapf_exclude"], *non_source_files), r"\.(_)?py")
 
 	formate = Repo(
 			repo=make_github_url("python-formate", "formate"),
@@ -299,10 +425,7 @@ def make_pre_commit(repo_path: pathlib.Path, templates: Environment) -> List[str
 	if not pre_commit_file.is_file():
 		pre_commit_file.touch()
 
-	dumper = ruamel.yaml.YAML()
-	dumper.indent(mapping=2, sequence=3, offset=1)
-
-	output = StringList([
+	header = [
 			f"# {templates.globals['managed_message']}",
 			"---",
 			'',
@@ -312,9 +435,7 @@ def make_pre_commit(repo_path: pathlib.Path, templates: Environment) -> List[str
 			"  autoupdate_schedule: quarterly",
 			'',
 			"repos:",
-			])
-
-	indent_re = re.compile("^ {3}")
+			]
 
 	managed_hooks = [
 			pyproject_parser,
@@ -336,13 +457,9 @@ def make_pre_commit(repo_path: pathlib.Path, templates: Environment) -> List[str
 
 	custom_hooks_comment = "# Custom hooks can be added below this comment"
 
-	for hook in managed_hooks:
-		buf = StringIO()
-		dumper.dump(hook.to_dict(), buf)
-		output.append(indent_re.sub(" - ", indent(buf.getvalue(), "   ")))
-		output.blankline(ensure_single=True)
-	output.append(custom_hooks_comment)
-	output.blankline(ensure_single=True)
+	# Each repository is separated from the next by a single blank line.
+	repos = [_repo_yaml(hook) for hook in managed_hooks]
+	repos.append(custom_hooks_comment)
 
 	raw_yaml = pre_commit_file.read_text()
 
@@ -359,18 +476,9 @@ def make_pre_commit(repo_path: pathlib.Path, templates: Environment) -> List[str
 			elif repo["repo"] not in managed_hooks_urls:
 				custom_hooks.append(Repo(**repo))
 
-		for hook in custom_hooks:
-			buf = StringIO()
-			dumper.dump(hook.to_dict(), buf)
-			output.append(indent_re.sub(" - ", indent(buf.getvalue(), "   ")))
-			output.blankline(ensure_single=True)
-
-		for hook in local_hooks:
-			buf = StringIO()
-			dumper.dump(hook, buf)
-			output.append(indent_re.sub(" - ", indent(buf.getvalue(), "   ")))
-			output.blankline(ensure_single=True)
+		repos.extend(_dump_repo(hook.to_dict()) for hook in custom_hooks)
+		repos.extend(_dump_repo(hook) for hook in local_hooks)
 
-	pre_commit_file.write_lines(output)
+	pre_commit_file.write_clean('\n'.join([*header, "\n\n".join(repo_yaml.rstrip() for repo_yaml in repos)]))
 
 	return [pre_commit_file.name]
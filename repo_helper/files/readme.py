@@ -36,9 +36,7 @@ from repo_helper.blocks import (
 		create_readme_install_block,
 		create_short_desc_block,
 		get_readme_installation_block_no_pypi_template,
-		installation_regex,
-		shields_regex,
-		short_desc_regex
+		replace_blocks
 		)
 from repo_helper.files import management
 from repo_helper.templates import Environment
@@ -98,11 +96,12 @@ def rewrite_readme(repo_path: pathlib.Path, templates: Environment) -> List[str]
 				repo_name=templates.globals["repo_name"],
 				)
 
-	readme = readme_file.read_text(encoding="UTF-8")
-	readme = shields_regex.sub(str(shields_block), readme)
-	readme = installation_regex.sub(install_block + '\n', readme)
-	short_desc_block = create_short_desc_block(templates.globals["short_desc"], )
-	readme = short_desc_regex.sub(short_desc_block, readme)
+	readme = replace_blocks(
+			readme_file.read_text(encoding="UTF-8"),
+			shields=str(shields_block),
+			installation=install_block + '\n',
+			short_desc=create_short_desc_block(templates.globals["short_desc"]),
+			)
 
 	readme_file.write_clean(readme)
 
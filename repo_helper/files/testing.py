@@ -200,11 +200,10 @@ class ToxConfig(IniConfigurator):
 		tox_envs: List[str] = []
 		cov_envlist: List[str] = []
 
-		for third_party_library in self["third_party_version_matrix"]:
-
-			python_versions = self["python_versions"]
-			tox_py_versions = get_tox_python_versions(self["python_versions"])
+		python_versions = self["python_versions"]
+		tox_py_versions = get_tox_python_versions(python_versions)
 
+		for third_party_library in self["third_party_version_matrix"]:
 			for (py_version, metadata), tox_py_version in zip(
 				python_versions.items(),
 				tox_py_versions,
@@ -539,10 +538,8 @@ class ToxConfig(IniConfigurator):
 		``[flake8]``.
 		"""
 
-		test_ignores = list(code_only_warning)
-		test_ignores.remove("E301")
-		test_ignores.remove("E302")
-		test_ignores.remove("E305")
+		blank_line_codes = {"E301", "E302", "E305"}
+		test_ignores = [code for code in code_only_warning if code not in blank_line_codes]
 
 		self._ini["flake8"]["max-line-length"] = "120"
 		self._ini["flake8"]["select"] = f"{DelimitedList(lint_warn_list + code_only_warning): }"
@@ -25,13 +25,14 @@ and the directory representing the files used to initialise a new repository (:d
 #
 
 # stdlib
-from typing import Any, Dict
+import functools
+from typing import Any, Dict, Optional
 
 # 3rd party
 import jinja2
 from domdf_python_tools.paths import PathPlus
 
-__all__ = ["template_dir", "init_repo_template_dir"]
+__all__ = ["template_dir", "init_repo_template_dir", "get_bytecode_cache"]
 
 #: The templates directory.
 template_dir = (PathPlus(__file__).parent).absolute()
@@ -46,3 +47,19 @@ class Environment(jinja2.Environment):
 
 Environment.__module__ = jinja2.Environment.__module__
 Environment.__qualname__ = jinja2.Environment.__qualname__
+
+
+@functools.lru_cache(1)
+def get_bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+	"""
+	Returns the cache used to store compiled templates between invocations of ``repo_helper``.
+
+	Caching is best-effort: :py:obj:`None` is returned if a safe cache directory cannot be created.
+
+	.. versionadded:: $VERSION
+	"""
+
+	try:
+		return jinja2.FileSystemBytecodeCache(pattern="__repo_helper_%s.cache")
+	except (RuntimeError, OSError):
+		return None
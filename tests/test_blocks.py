@@ -32,10 +32,13 @@ from repo_helper.blocks import (
 		create_docs_links_block,
 		create_readme_install_block,
 		create_short_desc_block,
+		get_docs_links_block_template,
 		installation_regex,
 		links_regex,
+		replace_blocks,
 		shields_regex,
-		short_desc_regex
+		short_desc_regex,
+		template_from_file
 		)
 
 
@@ -76,6 +79,63 @@ def test_short_desc_regex(value):
 	assert m == "hello world"
 
 
+def test_replace_blocks():
+	text = '\n'.join([
+			".. start shields\nold shields\n.. end shields",
+			".. start short-desc\nold desc\n.. end short-desc",
+			".. start installation\nold installation\n.. end installation",
+			".. start links\nold links\n.. end links",
+			'',
+			])
+
+	assert replace_blocks(text, shields="SHIELDS", short_desc="DESC", installation="INSTALL\n") == '\n'.join([
+			"SHIELDS",
+			"DESC",
+			"INSTALL",
+			".. start links\nold links\n.. end links",
+			'',
+			])
+
+	assert replace_blocks(text) == text
+	assert replace_blocks("hello world", links="LINKS") == "hello world"
+	assert replace_blocks(".. start links\n.. end links", links="\\1") == "\\1"
+
+	# An unterminated block is left alone
+	text = ".. start links\n.. start shields\n.. end shields"
+	assert replace_blocks(text, links="LINKS", shields="SHIELDS") == ".. start links\nSHIELDS"
+
+	with pytest.raises(TypeError, match=r"Unknown block\(s\): foo"):
+		replace_blocks(text, foo="bar")
+
+
+def test_shields_block_platforms():
+	platforms = ["Linux", "Windows"]
+	shields_block = ShieldsBlock(username="octocat", repo_name="hello-world", version="1.2.3", platforms=platforms)
+	assert shields_block.platforms == {"Linux", "Windows"}
+	assert isinstance(shields_block.platforms, set)
+
+	frozen_platforms = frozenset(platforms)
+	shields_block = ShieldsBlock(
+			username="octocat",
+			repo_name="hello-world",
+			version="1.2.3",
+			platforms=frozen_platforms,
+			)
+	assert shields_block.platforms is frozen_platforms
+
+
+def test_template_from_file_globals():
+	first = template_from_file("docs_links_block_template.rst", foo=1)
+	second = template_from_file("docs_links_block_template.rst", bar=2)
+
+	assert first is not second
+	assert first is not get_docs_links_block_template()
+	assert first.globals["foo"] == 1
+	assert "bar" not in first.globals
+	assert second.globals["bar"] == 2
+	assert "foo" not in second.globals
+
+
 @pytest.mark.parametrize(
 		"kwargs",
 		[
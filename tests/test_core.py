@@ -2,6 +2,7 @@
 import re
 
 # 3rd party
+import jinja2
 import pytest
 from click import Abort
 from coincidence.regressions import check_file_regression
@@ -13,6 +14,7 @@ from southwark import status
 # this package
 from repo_helper.cli.utils import run_repo_helper
 from repo_helper.core import RepoHelper
+from repo_helper.templates import get_bytecode_cache
 
 
 def test_via_run_repo_helper(
@@ -112,6 +114,22 @@ def test_repo_name(temp_repo):
 	assert rh.repo_name == "repo_helper_demo"
 
 
+@pytest.mark.parametrize("exception", [RuntimeError, OSError])
+def test_bytecode_cache_unavailable(temp_repo, monkeypatch, exception):
+
+	def raise_error(*args, **kwargs):
+		raise exception("Cannot determine safe temp directory.")
+
+	monkeypatch.setattr(jinja2, "FileSystemBytecodeCache", raise_error)
+	get_bytecode_cache.cache_clear()
+
+	try:
+		assert get_bytecode_cache() is None
+		assert RepoHelper(temp_repo.path).templates.bytecode_cache is None
+	finally:
+		get_bytecode_cache.cache_clear()
+
+
 def test_not_repo_dir(tmp_pathplus, capsys):
 	with pytest.raises(Abort):
 		run_repo_helper(tmp_pathplus, force=False, initialise=False, commit=False, message='')
@@ -25,12 +25,13 @@ import posixpath
 from typing import Sequence
 
 # 3rd party
+import attr
 import pytest
 from coincidence.regressions import AdvancedFileRegressionFixture
 from domdf_python_tools.paths import PathPlus
 
 # this package
-from repo_helper.files.pre_commit import make_pre_commit
+from repo_helper.files.pre_commit import Repo, make_pre_commit, pygrep_hooks, pyupgrade
 from repo_helper.files.testing import ensure_tests_requirements, make_formate_toml, make_isort, make_tox, make_yapf
 
 
@@ -397,6 +398,27 @@ def test_ensure_tests_requirements_extras(tmp_pathplus, demo_environment):
 			]
 
 
+def test_repo_to_dict():
+	repo = Repo(repo="https://github.com/domdfcoding/flake2lint", rev="v0.4.2", hooks=["flake2lint"])
+	expected = {
+			"repo": "https://github.com/domdfcoding/flake2lint",
+			"rev": "v0.4.2",
+			"hooks": [{"id": "flake2lint"}],
+			}
+
+	assert repo.to_dict() == expected
+	assert repo.to_dict() is not repo.to_dict()
+
+	repo.to_dict()["extra"] = "value"
+	assert repo.to_dict() == expected
+
+	assert [field.name for field in attr.fields(Repo)] == ["repo", "rev", "hooks"]
+	assert list(attr.asdict(repo)) == ["repo", "rev", "hooks"]
+
+	repo.rev = "v0.5.0"
+	assert repo.to_dict()["rev"] == "v0.5.0"
+
+
 def test_make_pre_commit(
 		tmp_pathplus: PathPlus,
 		demo_environment,
@@ -411,3 +433,56 @@ def test_make_pre_commit(
 	managed_files = make_pre_commit(tmp_pathplus, demo_environment)
 	assert managed_files == [".pre-commit-config.yaml"]
 	advanced_file_regression.check_file(tmp_pathplus / managed_files[0])
+
+
+def test_make_pre_commit_modified_hooks(tmp_pathplus: PathPlus, demo_environment, monkeypatch):
+	demo_environment.globals["yapf_exclude"] = []
+	demo_environment.globals["pre_commit_exclude"] = "^$"
+
+	(tmp_pathplus / ".pre-commit-config.yaml").touch()
+
+	# Changes to the hooks of the module-level repositories must be reflected in the output.
+	monkeypatch.setitem(pyupgrade.hooks[0], "args", ["--py37-plus"])
+	pygrep_hooks.hooks.append({"id": "python-use-type-annotations"})
+
+	try:
+		make_pre_commit(tmp_pathplus, demo_environment)
+	finally:
+		pygrep_hooks.hooks.pop()
+
+	output = (tmp_pathplus / ".pre-commit-config.yaml").read_text()
+	assert "    - id: python-use-type-annotations\n" in output
+	assert "      args:\n       - --py37-plus\n" in output
+	assert "--py36-plus" not in output
+
+
+def test_make_pre_commit_custom_hooks(
+		tmp_pathplus: PathPlus,
+		demo_environment,
+		advanced_file_regression: AdvancedFileRegressionFixture,
+		):
+	demo_environment.globals["yapf_exclude"] = ["hello_world/a_very_long_module_name", "hello_world/another_long_module"]
+	demo_environment.globals["pre_commit_exclude"] = "^$"
+
+	(tmp_pathplus / ".pre-commit-config.yaml").write_lines([
+			"# Custom hooks can be added below this comment",
+			'',
+			" - repo: https://github.com/pre-commit/mirrors-mypy",
+			"   rev: '3.9'",
+			"   hooks:",
+			"    - id: mypy",
+			"      args: ['--strict', 'yes', '---', 'foo: bar']",
+			'',
+			" - repo: local",
+			"   hooks:",
+			"    - id: pylint",
+			"      name: pylint",
+			"      entry: pylint",
+			"      language: system",
+			"      types: [python]",
+			"      require_serial: true",
+			])
+
+	managed_files = make_pre_commit(tmp_pathplus, demo_environment)
+	assert managed_files == [".pre-commit-config.yaml"]
+	advanced_file_regression.check_file(tmp_pathplus / managed_files[0])
@@ -1,3 +1,6 @@
+# stdlib
+import os
+
 # 3rd party
 import pytest
 import requests.exceptions
@@ -7,22 +10,31 @@ from coincidence.regressions import check_file_output
 # this package
 from repo_helper.cli.commands.init import init_repo
 
-has_internet = True
-try:
-	RequestsURL("https://raw.githubusercontent.com").head(timeout=10)
-except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
-	has_internet = False
+@pytest.fixture(scope="session")
+def has_internet() -> bool:
+	if os.environ.get("REPO_HELPER_ASSUME_OFFLINE"):
+		return False
+
+	try:
+		RequestsURL("https://raw.githubusercontent.com").head(timeout=2)
+	except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+		return False
+
+	return True
 
 
 @pytest.mark.flaky(reruns=2, reruns_delay=10)
-@pytest.mark.skipif(condition=not has_internet, reason="Requires internet connection.")
 def test_init_repo(
+		has_internet: bool,
 		temp_empty_repo,
 		demo_environment,
 		file_regression,
 		data_regression,
 		fixed_date,
 		):
+	if not has_internet:
+		pytest.skip("Requires internet connection.")
+
 	demo_environment.globals["copyright_years"] = "2020-2021"
 	demo_environment.globals["author"] = "Joe Bloggs"
 	demo_environment.globals["email"] = "j.bloggs@example.com"
@@ -39,10 +51,13 @@ def test_init_repo(
 		assert (temp_empty_repo.path / file).exists(), file
 
 	listing = []
-	for path in temp_empty_repo.path.rglob("*.*"):
-		path = path.relative_to(temp_empty_repo.path)
-		if not path.parts[0] == ".git":
-			listing.append(path.as_posix())
+	for root, dirs, files in os.walk(temp_empty_repo.path):
+		if ".git" in dirs:
+			dirs.remove(".git")
+
+		for name in (*dirs, *files):
+			if '.' in name:
+				listing.append(os.path.relpath(os.path.join(root, name), temp_empty_repo.path).replace(os.sep, '/'))
 
 	listing.sort()
 